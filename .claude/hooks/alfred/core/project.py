@@ -4,13 +4,25 @@
 Project information inquiry (language, Git, SPEC progress, etc.)
 """
 
+import functools
 import json
+import os
 import signal
 import subprocess
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+from core.ttl_cache import ttl_cache
+from core.version_cache import VersionCache
+
+# Version check results are global to the installed package, not per project
+VERSION_CACHE_DIR = Path.home() / ".claude" / "cache"
+
+# Per-command Git timeout (seconds) - keeps SessionStart within its 2-3s budget
+GIT_COMMAND_TIMEOUT = 1.5
+
 
 class TimeoutError(Exception):
     """Signal-based timeout exception"""
@@ -18,14 +30,19 @@ class TimeoutError(Exception):
 
 
 @contextmanager
-def timeout_handler(seconds: int):
+def timeout_handler(seconds: float):
     """Hard timeout using SIGALRM (works on Unix systems including macOS)
 
     This uses kernel-level signal to interrupt ANY blocking operation,
     even if subprocess.run() timeout fails on macOS.
 
+    Signal handlers can only be installed from the main thread, and Windows
+    has no SIGALRM. When called from a worker thread (e.g. SessionStart
+    collectors running concurrently) or without SIGALRM, this is a no-op and
+    callers rely on their own subprocess/socket timeouts.
+
     Args:
-        seconds: Timeout duration in seconds
+        seconds: Timeout duration in seconds (fractions allowed via setitimer)
 
     Raises:
         TimeoutError: If operation exceeds timeout
@@ -33,16 +50,21 @@ def timeout_handler(seconds: int):
     def _handle_timeout(signum, frame):
         raise TimeoutError(f"Operation timed out after {seconds} seconds")
 
+    if not hasattr(signal, "SIGALRM") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
     # Set the signal handler
     old_handler = signal.signal(signal.SIGALRM, _handle_timeout)
-    signal.alarm(seconds)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
     try:
         yield
     finally:
-        signal.alarm(0)  # Disable alarm
+        signal.setitimer(signal.ITIMER_REAL, 0)  # Disable alarm
         signal.signal(signal.SIGALRM, old_handler)
 
 
+@functools.lru_cache(maxsize=8)
 def detect_language(cwd: str) -> str:
     """Detect project language (supports 20 items languages)
 
@@ -71,6 +93,7 @@ def detect_language(cwd: str) -> str:
         - RED: Write a 21 items language detection test (20 items language + 1 items unknown)
         - GREEN: 20 items language + unknown implementation, all tests passed
         - REFACTOR: Optimize file inspection order, apply TypeScript priority principle
+        - PERF: Memoized per cwd for the process lifetime (lru_cache)
     """
     cwd_path = Path(cwd)
 
@@ -121,7 +144,7 @@ def detect_language(cwd: str) -> str:
     return "Unknown Language"
 
 
-def _run_git_command(args: list[str], cwd: str, timeout: int = 2) -> str:
+def _run_git_command(args: list[str], cwd: str, timeout: float = 2, text: bool = True) -> str | bytes:
     """Git command execution with HARD timeout protection
 
     Safely execute Git commands and return output.
@@ -132,6 +155,8 @@ def _run_git_command(args: list[str], cwd: str, timeout: int = 2) -> str:
         args: Git command argument list (git adds automatically)
         cwd: Execution directory path
         timeout: Timeout (seconds, default 2 seconds)
+        text: Decode output as text (False returns raw bytes, e.g. for
+            -z output whose paths need not be valid in the locale encoding)
 
     Returns:
         Git command output (stdout, removing leading and trailing spaces)
@@ -155,8 +180,9 @@ def _run_git_command(args: list[str], cwd: str, timeout: int = 2) -> str:
                 ["git"] + args,
                 cwd=cwd,
                 capture_output=True,
-                text=True,
+                text=text,
                 check=False,  # Don't raise on non-zero exit - we'll check manually
+                timeout=timeout,  # Fallback when SIGALRM is unavailable (worker threads)
             )
 
             # Check exit code manually
@@ -172,6 +198,139 @@ def _run_git_command(args: list[str], cwd: str, timeout: int = 2) -> str:
         raise subprocess.TimeoutExpired(["git"] + args, timeout)
 
 
+def _find_git_dir(cwd: str) -> str | None:
+    """Locate the .git directory for cwd by walking up parent directories
+
+    Returns None when no plain .git directory is found, including worktrees
+    and submodules (where .git is a "gitdir:" file) - callers then defer to git.
+    """
+    path = os.path.abspath(cwd)
+    while True:
+        candidate = os.path.join(path, ".git")
+        if os.path.isdir(candidate):
+            return candidate
+        if os.path.exists(candidate):
+            # gitdir file (worktree/submodule) - let git resolve it
+            return None
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def read_git_head(cwd: str) -> tuple[str, str] | None:
+    """Read branch and commit straight from .git/HEAD and the ref files
+
+    Returns:
+        (branch, commit) tuple - branch is "" for a detached HEAD.
+        None if the answer can't be read from the filesystem (no .git
+        directory, GIT_DIR override, unborn branch, unexpected contents).
+    """
+    if "GIT_DIR" in os.environ:
+        return None
+
+    git_dir = _find_git_dir(cwd)
+    if git_dir is None:
+        return None
+
+    try:
+        with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+
+        if not head.startswith("ref: "):
+            # Detached HEAD - the file holds the commit hash itself
+            return ("", head) if len(head) in (40, 64) else None
+
+        ref = head[len("ref: "):]
+        branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+
+        # Loose ref file first, then packed-refs ("<sha> <refname>" per line)
+        try:
+            with open(os.path.join(git_dir, ref), encoding="utf-8") as f:
+                commit = f.read().strip()
+        except FileNotFoundError:
+            commit = ""
+            with open(os.path.join(git_dir, "packed-refs"), encoding="utf-8") as f:
+                for line in f:
+                    sha, _, name = line.rstrip("\n").partition(" ")
+                    if name == ref:
+                        commit = sha
+                        break
+
+        return (branch, commit) if len(commit) in (40, 64) else None
+
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def get_git_head(cwd: str) -> tuple[str, str]:
+    """Current branch name and commit hash, without a subprocess when possible
+
+    Reads .git/HEAD and the referenced ref (loose or packed) directly.
+    Falls back to a single `git rev-parse HEAD --abbrev-ref HEAD` for layouts
+    the fast path doesn't handle (worktrees, submodules, GIT_DIR, unborn branch).
+
+    Args:
+        cwd: Project root directory path
+
+    Returns:
+        (branch, commit) tuple - branch is "" for a detached HEAD
+        (same as `git branch --show-current`), commit is the full hash.
+
+    Raises:
+        subprocess.CalledProcessError: Not a git repository (fallback path)
+        subprocess.TimeoutExpired: Fallback git command timed out
+        FileNotFoundError: git executable not found (fallback path)
+
+    Examples:
+        >>> get_git_head("/path/to/git/repo")
+        ('main', 'abc123...')
+    """
+    head = read_git_head(cwd)
+    if head is not None:
+        return head
+
+    # --abbrev-ref applies to the revisions after it: full hash first, then name
+    output = _run_git_command(["rev-parse", "HEAD", "--abbrev-ref", "HEAD"], cwd, timeout=GIT_COMMAND_TIMEOUT)
+    commit, _, abbrev = output.partition("\n")
+    return ("" if abbrev == "HEAD" else abbrev, commit)
+
+
+def count_git_changes(cwd: str) -> int:
+    """Number of changed tracked files (staged + unstaged)
+
+    Uses porcelain v2 status. No --branch: callers get HEAD elsewhere and it
+    would add upstream ahead/behind computation. -uno skips the untracked-file
+    directory walk that dominates `git status` on large repositories; -z gives
+    NUL-terminated records. Output is counted as bytes - only the record
+    separators matter, and paths need not decode in the locale encoding.
+
+    Args:
+        cwd: Project root directory path
+
+    Returns:
+        Changed tracked file count (untracked files are not counted)
+
+    Raises:
+        subprocess.CalledProcessError: Not a git repository
+        subprocess.TimeoutExpired: git status exceeded GIT_COMMAND_TIMEOUT
+        FileNotFoundError: git executable not found
+    """
+    status_output = _run_git_command(
+        ["status", "--porcelain=v2", "-uno", "-z"], cwd, timeout=GIT_COMMAND_TIMEOUT, text=False
+    )
+
+    changes = 0
+    records = iter(status_output.split(b"\0"))
+    for record in records:
+        if record:
+            changes += 1
+            if record.startswith(b"2 "):
+                # Rename/copy records carry the original path as an extra field
+                next(records, None)
+    return changes
+
+
 def get_git_info(cwd: str) -> dict[str, Any]:
     """Gather Git repository information
 
@@ -186,7 +345,8 @@ def get_git_info(cwd: str) -> dict[str, Any]:
         Git information dictionary. Includes the following keys:
         - branch: Current branch name (str)
         - commit: Current commit hash (str, full hash)
-        - changes: Number of changed files (int, staged + unstaged)
+        - changes: Number of changed tracked files (int, staged + unstaged;
+          untracked files are not counted)
         - last_commit: Last commit message (str, subject only)
 
         Empty dictionary {} if it is not a Git repository or the query fails.
@@ -198,7 +358,9 @@ def get_git_info(cwd: str) -> dict[str, Any]:
         {}
 
     Notes:
-        - Timeout: 2 seconds for each Git command
+        - Branch/commit read from .git/HEAD (get_git_head); Git processes per
+          call: `status --porcelain=v2` and `log -1`
+        - Timeout: GIT_COMMAND_TIMEOUT (1.5 seconds) for each Git command
         - Security: Safe execution with subprocess.run(shell=False)
         - Error handling: Returns an empty dictionary in case of all exceptions
         - Commit message limited to 50 characters for display purposes
@@ -208,19 +370,18 @@ def get_git_info(cwd: str) -> dict[str, Any]:
         - GREEN: Implementation of subprocess-based Git command execution
         - REFACTOR: Add timeout (2 seconds), strengthen exception handling, remove duplicates with helper function
         - UPDATE: Added last_commit message field for SessionStart display
+        - PERF: Collapse rev-parse/branch/status into one porcelain v2 status call
+        - PERF: Skip untracked-file enumeration (-uno) and parse NUL-terminated records
+        - PERF: Read branch/commit from .git/HEAD instead of `status --branch`
     """
     try:
-        # Check if it's a git repository
-        _run_git_command(["rev-parse", "--git-dir"], cwd)
-
-        # Get branch name, commit hash, and changes
-        branch = _run_git_command(["branch", "--show-current"], cwd)
-        commit = _run_git_command(["rev-parse", "HEAD"], cwd)
-        status_output = _run_git_command(["status", "--short"], cwd)
-        changes = len([line for line in status_output.splitlines() if line])
+        # Branch name and commit hash from .git files (git fallback raises
+        # CalledProcessError outside a git repository)
+        branch, commit = get_git_head(cwd)
+        changes = count_git_changes(cwd)
 
         # Get last commit message (subject only, limited to 50 chars)
-        last_commit = _run_git_command(["log", "-1", "--format=%s"], cwd)
+        last_commit = _run_git_command(["log", "-1", "--format=%s"], cwd, timeout=GIT_COMMAND_TIMEOUT)
         if len(last_commit) > 50:
             last_commit = last_commit[:47] + "..."
 
@@ -231,7 +392,12 @@ def get_git_info(cwd: str) -> dict[str, Any]:
             "last_commit": last_commit,
         }
 
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+    except (
+        subprocess.TimeoutExpired,
+        subprocess.CalledProcessError,
+        FileNotFoundError,
+        UnicodeDecodeError,
+    ):
         return {}
 
 
@@ -267,37 +433,43 @@ def count_specs(cwd: str) -> dict[str, int]:
         - RED: 5 items scenario test (0/0, 2/5, 5/5, no directory, parsing error)
         - GREEN: SPEC search with Path.iterdir(), YAML parsing implementation
         - REFACTOR: Strengthened exception handling, improved percentage calculation safety
+        - PERF: os.scandir + direct open instead of Path.iterdir/exists/read_text
     """
-    specs_dir = Path(cwd) / ".moai" / "specs"
-
-    if not specs_dir.exists():
-        return {"completed": 0, "total": 0, "percentage": 0}
+    specs_dir = os.path.join(cwd, ".moai", "specs")
 
     completed = 0
     total = 0
 
-    for spec_dir in specs_dir.iterdir():
-        if not spec_dir.is_dir() or not spec_dir.name.startswith("SPEC-"):
+    # os.scandir reuses directory entry types (no extra stat per entry)
+    try:
+        entries = list(os.scandir(specs_dir))
+    except OSError:
+        return {"completed": 0, "total": 0, "percentage": 0}
+
+    for entry in entries:
+        if not entry.name.startswith("SPEC-") or not entry.is_dir():
             continue
 
-        spec_file = spec_dir / "spec.md"
-        if not spec_file.exists():
+        # Open directly instead of exists() + read (one syscall fewer)
+        try:
+            with open(os.path.join(entry.path, "spec.md"), encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            continue
+        except (OSError, UnicodeDecodeError):
+            # File read failure or encoding error - considered incomplete
+            total += 1
             continue
 
         total += 1
 
         # Parse YAML front matter
-        try:
-            content = spec_file.read_text()
-            if content.startswith("---"):
-                yaml_end = content.find("---", 3)
-                if yaml_end > 0:
-                    yaml_content = content[3:yaml_end]
-                    if "status: completed" in yaml_content:
-                        completed += 1
-        except (OSError, UnicodeDecodeError):
-            # File read failure or encoding error - considered incomplete
-            pass
+        if content.startswith("---"):
+            yaml_end = content.find("---", 3)
+            if yaml_end > 0:
+                yaml_content = content[3:yaml_end]
+                if "status: completed" in yaml_content:
+                    completed += 1
 
     percentage = int(completed / total * 100) if total > 0 else 0
 
@@ -336,42 +508,26 @@ def get_project_language(cwd: str) -> str:
     return detect_language(cwd)
 
 
-def get_package_version_info() -> dict[str, Any]:
-    """Check MoAI-ADK current and latest version from PyPI
+def _fetch_package_version_info(current: str) -> dict[str, Any]:
+    """Query PyPI for the latest MoAI-ADK version and compare with current
 
-    Compares the installed version with the latest version available on PyPI.
-    Returns version information for SessionStart hook to display update recommendations.
+    Args:
+        current: Currently installed version
 
     Returns:
-        dict with keys:
-            - "current": Current installed version
-            - "latest": Latest version available on PyPI
-            - "update_available": Boolean indicating if update is available
-            - "upgrade_command": Recommended upgrade command (if update available)
-
-    Note:
-        - Has 1-second timeout to avoid blocking SessionStart
-        - Returns graceful fallback if PyPI check fails
-        - Handles version parsing gracefully
+        Version info dictionary (see get_package_version_info).
+        "latest" stays "unknown" if PyPI could not be reached.
     """
     import urllib.error
     import urllib.request
-    from importlib.metadata import PackageNotFoundError, version
 
     result = {
-        "current": "unknown",
+        "current": current,
         "latest": "unknown",
         "update_available": False,
         "upgrade_command": ""
     }
 
-    # Get current version
-    try:
-        result["current"] = version("moai-adk")
-    except PackageNotFoundError:
-        result["current"] = "dev"
-        return result
-
     # Get latest version from PyPI (with 1-second timeout)
     try:
         with timeout_handler(1):
@@ -407,8 +563,82 @@ def get_package_version_info() -> dict[str, Any]:
     return result
 
 
+def _refresh_version_cache(version_cache: VersionCache, current: str) -> dict[str, Any]:
+    """Fetch version info from PyPI and store it on disk if PyPI answered"""
+    result = _fetch_package_version_info(current)
+    if result["latest"] != "unknown":
+        # Don't cache failures - the next session should retry
+        version_cache.save(dict(result))
+    return result
+
+
+@ttl_cache(ttl_seconds=1800)
+def get_package_version_info() -> dict[str, Any]:
+    """Check MoAI-ADK current and latest version from PyPI
+
+    Compares the installed version with the latest version available on PyPI.
+    Returns version information for SessionStart hook to display update recommendations.
+
+    Returns:
+        dict with keys:
+            - "current": Current installed version
+            - "latest": Latest version available on PyPI
+            - "update_available": Boolean indicating if update is available
+            - "upgrade_command": Recommended upgrade command (if update available)
+
+    Note:
+        - Has 1-second timeout to avoid blocking SessionStart
+        - Returns graceful fallback if PyPI check fails
+        - Handles version parsing gracefully
+        - Result is memoized in-process for 30 minutes (ttl_cache)
+        - PyPI results are cached on disk (VERSION_CACHE_DIR) for 24 hours;
+          an expired entry is served immediately while a background thread
+          refreshes it, so only the very first check delays the message
+          (the process itself exits once the refresh finishes)
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    # Get current version
+    try:
+        current = version("moai-adk")
+    except PackageNotFoundError:
+        return {
+            "current": "dev",
+            "latest": "unknown",
+            "update_available": False,
+            "upgrade_command": ""
+        }
+
+    version_cache = VersionCache(VERSION_CACHE_DIR)
+
+    # Fast path: fresh cache for the installed version
+    cached_info = version_cache.load()
+    if cached_info and cached_info.get("current") == current:
+        return cached_info
+
+    # Stale cache: serve last-known-good, refresh for the next session.
+    # Explicitly non-daemon (threads inherit daemon=True from the SessionStart
+    # collector) so the refresh completes after the hook response is printed;
+    # process exit waits for it (bounded by the PyPI request timeout).
+    stale_info = version_cache.load(allow_expired=True)
+    if stale_info and stale_info.get("current") == current:
+        threading.Thread(
+            target=_refresh_version_cache,
+            args=(version_cache, current),
+            name="version-cache-refresh",
+            daemon=False,
+        ).start()
+        return stale_info
+
+    # No usable cache (first run or package upgraded locally) - query now
+    return _refresh_version_cache(version_cache, current)
+
+
 __all__ = [
     "detect_language",
+    "read_git_head",
+    "get_git_head",
+    "count_git_changes",
     "get_git_info",
     "count_specs",
     "get_project_language",
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""SessionStart snapshot cache
+
+Persists the data collected for the SessionStart message, keyed by a cheap
+filesystem fingerprint of everything it depends on, so an unchanged project
+skips the collectors (language detection, commit subject, SPEC parsing,
+checkpoint log, version check) on the next session start.
+
+The changed-file count is NOT part of the snapshot: unstaged edits leave no
+cheap filesystem trace, so callers must recount it (count_git_changes).
+"""
+
+import json
+import os
+import time
+from typing import Any
+
+from core.project import VERSION_CACHE_DIR, read_git_head
+from core.version_cache import VersionCache
+
+# Snapshot entries per project directory, next to the version check cache
+SNAPSHOT_FILE = VERSION_CACHE_DIR / "session_snapshot.json"
+
+# Upper bound on snapshot age (seconds) - bounds staleness of inputs the
+# fingerprint can't see (e.g. installed package upgrades)
+SNAPSHOT_TTL_SECONDS = 3600
+
+
+def _stat_key(path: str) -> list[int] | None:
+    """(mtime_ns, size) of path as a JSON-friendly list, None if missing"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def compute_fingerprint(cwd: str) -> list[Any] | None:
+    """Cheap fingerprint of every SessionStart input (stat calls only)
+
+    Args:
+        cwd: Project root directory path
+
+    Returns:
+        JSON-serializable fingerprint, or None if HEAD can't be read from
+        the filesystem (non-git directory, worktree, GIT_DIR) - in that case
+        the snapshot is not used.
+
+    Components:
+        - Absolute project path
+        - HEAD branch and commit (.git/HEAD + ref)
+        - Project root directory stat (files added/removed -> language)
+        - .moai/checkpoints.log stat
+        - Stat of every .moai/specs/SPEC-*/spec.md
+        - Version check cache stat
+    """
+    head = read_git_head(cwd)
+    if head is None:
+        return None
+
+    specs = []
+    try:
+        with os.scandir(os.path.join(cwd, ".moai", "specs")) as it:
+            for entry in it:
+                if entry.name.startswith("SPEC-"):
+                    specs.append([entry.name, _stat_key(os.path.join(entry.path, "spec.md"))])
+    except OSError:
+        pass
+    specs.sort()
+
+    return [
+        os.path.abspath(cwd),
+        list(head),
+        _stat_key(cwd),
+        _stat_key(os.path.join(cwd, ".moai", "checkpoints.log")),
+        specs,
+        _stat_key(str(VersionCache(VERSION_CACHE_DIR).cache_file)),
+    ]
+
+
+def _read_snapshots() -> dict[str, Any]:
+    try:
+        with open(SNAPSHOT_FILE, encoding="utf-8") as f:
+            snapshots = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return snapshots if isinstance(snapshots, dict) else {}
+
+
+def load_snapshot(fingerprint: list[Any]) -> dict[str, Any] | None:
+    """Load snapshot data if it was saved under the same fingerprint
+
+    Returns:
+        Snapshot data dictionary, or None on miss/expiry/read error
+    """
+    entry = _read_snapshots().get(fingerprint[0])
+    if not isinstance(entry, dict) or entry.get("key") != fingerprint:
+        return None
+    saved_at = entry.get("saved_at")
+    if not isinstance(saved_at, (int, float)) or time.time() - saved_at > SNAPSHOT_TTL_SECONDS:
+        return None
+    data = entry.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def save_snapshot(fingerprint: list[Any], data: dict[str, Any]) -> bool:
+    """Store snapshot data for the fingerprint's project (atomic write)
+
+    Expired entries of other projects are pruned on the same write, so the
+    file only holds projects opened within SNAPSHOT_TTL_SECONDS.
+
+    Returns:
+        True on successful save, False on error
+    """
+    now = time.time()
+    snapshots = {
+        path: entry
+        for path, entry in _read_snapshots().items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("saved_at"), (int, float))
+        and now - entry["saved_at"] <= SNAPSHOT_TTL_SECONDS
+    }
+    snapshots[fingerprint[0]] = {"key": fingerprint, "saved_at": now, "data": data}
+
+    try:
+        SNAPSHOT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = SNAPSHOT_FILE.with_name(f"{SNAPSHOT_FILE.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(snapshots, f)
+        os.replace(tmp_file, SNAPSHOT_FILE)
+        return True
+    except (OSError, TypeError, ValueError):
+        # Graceful degradation on write errors
+        return False
+
+
+__all__ = ["compute_fingerprint", "load_snapshot", "save_snapshot"]
@@ -10,6 +10,7 @@ Phase 1: Cache System Implementation
 """
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -51,7 +52,8 @@ class VersionCache:
     def _calculate_age_hours(self, last_check_iso: str) -> float:
         """Calculate age in hours from ISO timestamp (internal helper)
 
-        Normalizes timezone-aware and naive datetimes for consistent comparison.
+        Compares in UTC: aware timestamps (written by save) are converted,
+        naive ones are taken as local time.
 
         Args:
             last_check_iso: ISO format timestamp string
@@ -64,11 +66,10 @@ class VersionCache:
         """
         last_check = datetime.fromisoformat(last_check_iso)
 
-        # Normalize to naive datetime (remove timezone for comparison)
-        if last_check.tzinfo is not None:
-            last_check = last_check.replace(tzinfo=None)
+        # astimezone() treats a naive datetime as local time
+        last_check = last_check.astimezone(timezone.utc)
 
-        now = datetime.now()
+        now = datetime.now(timezone.utc)
         return (now - last_check).total_seconds() / 3600
 
     def is_valid(self) -> bool:
@@ -96,9 +97,13 @@ class VersionCache:
             # Corrupted or invalid cache file
             return False
 
-    def load(self) -> dict[str, Any] | None:
+    def load(self, allow_expired: bool = False) -> dict[str, Any] | None:
         """Load cached version info if valid
 
+        Args:
+            allow_expired: Also return expired entries (last-known-good data
+                to serve while a refresh runs in the background)
+
         Returns:
             Cached version info dictionary if valid, None otherwise
 
@@ -108,7 +113,7 @@ class VersionCache:
             >>> data is None
             True  # No valid cache exists
         """
-        if not self.is_valid():
+        if not allow_expired and not self.is_valid():
             return None
 
         try:
@@ -123,6 +128,8 @@ class VersionCache:
 
         Creates cache directory if it doesn't exist.
         Updates last_check timestamp to current time if not provided.
+        Writes to a temporary file and renames it so concurrent readers
+        never observe a partially written cache.
 
         Args:
             version_info: Version information dictionary to cache
@@ -143,9 +150,11 @@ class VersionCache:
             if "last_check" not in version_info:
                 version_info["last_check"] = datetime.now(timezone.utc).isoformat()
 
-            # Write to cache file
-            with open(self.cache_file, "w") as f:
+            # Write to a temp file, then atomically replace the cache file
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
                 json.dump(version_info, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
 
             return True
 
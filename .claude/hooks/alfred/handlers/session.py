@@ -5,60 +5,206 @@ SessionStart, SessionEnd event handling
 """
 
 import json
-from pathlib import Path
+import os
+import threading
+import time
+from io import StringIO
+from typing import Any
 
 from core import HookPayload, HookResult
-from core.checkpoint import list_checkpoints
-from core.project import count_specs, detect_language, get_git_info, get_package_version_info
+
+# Shared wait budget for all OPTIONAL SessionStart collectors (seconds)
+OPTIONAL_RESULT_TIMEOUT = 2.0
+
+# Checkpoint list is cosmetic - omit it rather than hold the message back (seconds)
+CHECKPOINT_RESULT_TIMEOUT = 0.3
+
+
+class _Collector:
+    """Run an OPTIONAL SessionStart collector on a daemon thread
+
+    Daemon threads are not joined at interpreter exit, so a collector that
+    outlives its wait budget can't keep the hook process alive after the
+    handler has answered.
+    """
+
+    def __init__(self, func: Any, *args: Any, **kwargs: Any):
+        # True once result() has returned the collector's own value
+        self.delivered = False
+        self._ok = False
+        self._value: Any = None
+        self._done = threading.Event()
+        threading.Thread(
+            target=self._run, args=(func, args, kwargs), name="session-start", daemon=True
+        ).start()
+
+    def _run(self, func: Any, args: tuple, kwargs: dict) -> None:
+        try:
+            self._value = func(*args, **kwargs)
+            self._ok = True
+        except Exception:
+            # Graceful degradation - result() falls back to its default
+            pass
+        finally:
+            self._done.set()
+
+    def result(self, deadline: float, default: Any) -> Any:
+        """Wait until deadline (time.monotonic), falling back to default on timeout/failure"""
+        if self._done.wait(max(0.0, deadline - time.monotonic())) and self._ok:
+            self.delivered = True
+            return self._value
+        return default
+
+
+# Global CLAUDE.md location (resolved once; plain strings avoid pathlib overhead)
+_GLOBAL_CLAUDE = os.path.join(os.path.expanduser("~"), ".claude", "CLAUDE.md")
+
+# Parsed @USER_CRITICAL rules per CLAUDE.md path: (st_mtime_ns, st_size, rules)
+_critical_cache: dict[str, tuple[int, int, list[str]]] = {}
+
+
+def _parse_user_critical(claude_path: str) -> list[str]:
+    """Extract @USER_CRITICAL rule lines from a single CLAUDE.md file
+
+    Streams the file line by line and stops reading as soon as the section
+    ends, so I/O is bounded by the section position rather than file size.
+    Lines are scanned as raw bytes; only lines inside the section are
+    decoded, so files without the marker are never UTF-8 decoded.
+    """
+    critical_rules = []
+    in_critical = False
+
+    with open(claude_path, "rb") as f:
+        for line in f:
+            if b"@USER_CRITICAL" in line:
+                in_critical = True
+                continue
+
+            if not in_critical:
+                continue
+
+            # Next section marker - the only section of interest is done
+            if line.startswith(b'#'):
+                break
+
+            # Extract rule lines (starting with - or **)
+            stripped = line.decode("utf-8", errors="replace").strip()
+            if stripped and not stripped.startswith('#') and not stripped.startswith('CRITICAL:'):
+                critical_rules.append(stripped)
+
+    return critical_rules
 
 
 def load_user_critical_from_claude() -> list:
     """Extract @USER_CRITICAL section from CLAUDE.md
 
-    Reads both global (~/.claude/CLAUDE.md) and project CLAUDE.md files
+    Reads the project CLAUDE.md first, then the global (~/.claude/CLAUDE.md),
     and extracts content between @USER_CRITICAL markers.
     Returns empty list if section not found or files don't exist.
-    """
-    critical_rules = []
 
-    # Try to read CLAUDE.md files
+    Precedence:
+        Project rules override global rules. The first file with a non-empty
+        @USER_CRITICAL section wins and the remaining file is not read.
+
+    Parsed rules are cached per file and reused while its mtime and size
+    are unchanged, so repeat calls cost one stat per file.
+    """
+    # Try to read CLAUDE.md files (highest precedence first)
     for claude_path in [
-        Path.home() / ".claude" / "CLAUDE.md",  # Global
-        Path.cwd() / "CLAUDE.md",  # Project root
+        os.path.join(os.getcwd(), "CLAUDE.md"),  # Project root
+        _GLOBAL_CLAUDE,  # Global
     ]:
-        if not claude_path.exists():
+        try:
+            st = os.stat(claude_path)
+        except OSError:
+            # Missing or unreadable file - nothing to extract
             continue
 
-        try:
-            with open(claude_path) as f:
-                content = f.read()
-
-            # Look for @USER_CRITICAL section
-            if "@USER_CRITICAL" in content:
-                # Extract content between @USER_CRITICAL and next # section
-                lines = content.split('\n')
-                in_critical = False
-
-                for line in lines:
-                    if "@USER_CRITICAL" in line:
-                        in_critical = True
-                        continue
-
-                    # Stop at next section marker
-                    if in_critical and line.startswith('#'):
-                        break
-
-                    # Extract rule lines (starting with - or **)
-                    if in_critical:
-                        stripped = line.strip()
-                        if stripped and not stripped.startswith('#') and not stripped.startswith('CRITICAL:'):
-                            critical_rules.append(stripped)
+        cached = _critical_cache.get(claude_path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            rules = cached[2]
+        else:
+            try:
+                rules = _parse_user_critical(claude_path)
+            except OSError:
+                # Graceful degradation if file read fails
+                continue
+            _critical_cache[claude_path] = (st.st_mtime_ns, st.st_size, rules)
+
+        if rules:
+            return list(rules)
+
+    return []
+
+
+def _build_session_message(
+    critical_rules: list,
+    language: str,
+    git_info: dict[str, Any],
+    specs: dict[str, int],
+    checkpoints: list[dict[str, str]],
+    version_info: dict[str, Any],
+) -> str:
+    """Render the SessionStart status message from collected project data"""
+    # Build message with available information
+    # system_message: displayed directly to the user
+    buf = StringIO()
+    w = buf.write
+    w("🚀 MoAI-ADK Session Started\n")
+    w("\n")  # Blank line after title
 
-        except Exception:
-            # Graceful degradation if file read fails
-            pass
+    # Add critical rules from CLAUDE.md if available
+    if critical_rules:
+        w("📋 Critical Rules (from @USER_CRITICAL):\n")
+        for rule in critical_rules:
+            w(f"   • {rule}\n")
+        w("\n")  # Blank line separator
 
-    return critical_rules
+    # Add version info first (at the top, right after title)
+    if version_info and version_info.get("current") != "unknown":
+        w(f"   🗿 MoAI-ADK Ver: {version_info['current']}")
+        if version_info.get("update_available"):
+            w(f" → {version_info['latest']} available ✨")
+        w("\n")
+
+        # Add upgrade recommendation if update is available
+        if version_info.get("update_available") and version_info.get("upgrade_command"):
+            w(f"   ⬆️ Upgrade: {version_info['upgrade_command']}\n")
+
+    # Add language info
+    w(f"   🐍 Language: {language}\n")
+
+    # Add Git info only if available (not degraded)
+    if git_info:
+        # get_git_info returns either {} or all keys, so index directly
+        branch = git_info["branch"]
+        commit = git_info["commit"][:7]
+        changes = git_info["changes"]
+        last_commit = git_info.get("last_commit")
+
+        w(f"   🌿 Branch: {branch} ({commit})\n")
+        w(f"   📝 Changes: {changes}\n")
+
+        # Add last commit message if available
+        if last_commit:
+            w(f"   🔨 Last: {last_commit}\n")
+
+    # Add Checkpoint list (show only the latest 3 items)
+    if checkpoints:
+        w(f"   🗂️  Checkpoints: {len(checkpoints)} available\n")
+        for cp in checkpoints[-1:-4:-1]:  # Latest 3 items, newest first
+            branch_short = cp["branch"].replace("before-", "")
+            w(f"      📌 {branch_short}\n")
+        w("\n")  # Blank line before restore command
+        w("   ↩️  Restore: /alfred:0-project restore\n")
+
+    # Add SPEC progress only if available (not degraded) - at the bottom
+    if specs["total"] > 0:
+        spec_progress = f"{specs['completed']}/{specs['total']}"
+        w(f"   📋 SPEC Progress: {spec_progress} ({specs['percentage']}%)\n")
+
+    # Every line is newline-terminated; drop the final one
+    return buf.getvalue()[:-1]
 
 
 def handle_session_start(payload: HookPayload) -> HookResult:
@@ -87,7 +233,10 @@ def handle_session_start(payload: HookPayload) -> HookResult:
         - CRITICAL: Language detection (must succeed - no try-except)
         - OPTIONAL: Git info (skip if timeout/failure)
         - OPTIONAL: SPEC progress (skip if timeout/failure)
-        - OPTIONAL: Checkpoint list (skip if timeout/failure)
+        - OPTIONAL: Checkpoint list (skip if not ready within CHECKPOINT_RESULT_TIMEOUT)
+        - OPTIONAL: Package version info (skip if timeout/failure)
+        - OPTIONAL collectors run concurrently on daemon threads, sharing one
+          OPTIONAL_RESULT_TIMEOUT deadline
         - Always display SOMETHING to user, never return empty message
 
     Note:
@@ -103,6 +252,9 @@ def handle_session_start(payload: HookPayload) -> HookResult:
         - FIX: Prevent duplicate output of clear step (only compact step is displayed)
         - UPDATE: Migrated to Claude Code standard Hook schema
         - HOTFIX: Add graceful degradation for timeout scenarios (Issue #66)
+        - PERF: Run OPTIONAL collectors concurrently under one shared deadline
+        - PERF: Reuse collected data from the on-disk session snapshot when the
+          project fingerprint is unchanged (core.session_snapshot)
 
     @TAG:CHECKPOINT-EVENT-001
     @TAG:HOOKS-TIMEOUT-001
@@ -114,103 +266,91 @@ def handle_session_start(payload: HookPayload) -> HookResult:
         # Return minimal valid Hook result for clear phase
         return HookResult(continue_execution=True)
 
+    # Deferred imports: the "clear" phase above never pays for loading them
+    # (sys.modules makes repeat imports a dict lookup)
+    from core.checkpoint import list_checkpoints
+    from core.project import (
+        count_git_changes,
+        count_specs,
+        detect_language,
+        get_git_info,
+        get_package_version_info,
+    )
+    from core.session_snapshot import compute_fingerprint, load_snapshot, save_snapshot
+
     cwd = payload.get("cwd", ".")
 
     # Load critical rules from CLAUDE.md @USER_CRITICAL section
     critical_rules = load_user_critical_from_claude()
 
-    # CRITICAL: Language detection - MUST succeed (no try-except)
-    language = detect_language(cwd)
-
-    # OPTIONAL: Git info - skip if timeout/failure
-    git_info = {}
-    try:
-        git_info = get_git_info(cwd)
-    except Exception:
-        # Graceful degradation - continue without git info
-        pass
-
-    # OPTIONAL: SPEC progress - skip if timeout/failure
-    specs = {"completed": 0, "total": 0, "percentage": 0}
-    try:
-        specs = count_specs(cwd)
-    except Exception:
-        # Graceful degradation - continue without spec info
-        pass
-
-    # OPTIONAL: Checkpoint list - skip if timeout/failure
-    checkpoints = []
-    try:
-        checkpoints = list_checkpoints(cwd, max_count=10)
-    except Exception:
-        # Graceful degradation - continue without checkpoints
-        pass
-
-    # OPTIONAL: Package version info - skip if timeout/failure
-    version_info = {}
-    try:
-        version_info = get_package_version_info()
-    except Exception:
-        # Graceful degradation - continue without version info
-        pass
-
-    # Build message with available information
-    branch = git_info.get("branch", "N/A") if git_info else "N/A"
-    commit = git_info.get("commit", "N/A")[:7] if git_info else "N/A"
-    changes = git_info.get("changes", 0) if git_info else 0
-    spec_progress = f"{specs['completed']}/{specs['total']}" if specs["total"] > 0 else "0/0"
-
-    # system_message: displayed directly to the user
-    lines = [
-        "🚀 MoAI-ADK Session Started",
-        "",  # Blank line after title
-    ]
-
-    # Add critical rules from CLAUDE.md if available
-    if critical_rules:
-        lines.append("📋 Critical Rules (from @USER_CRITICAL):")
-        for rule in critical_rules:
-            lines.append(f"   • {rule}")
-        lines.append("")  # Blank line separator
-
-    # Add version info first (at the top, right after title)
-    if version_info and version_info.get("current") != "unknown":
-        version_line = f"   🗿 MoAI-ADK Ver: {version_info['current']}"
-        if version_info.get("update_available"):
-            version_line += f" → {version_info['latest']} available ✨"
-        lines.append(version_line)
-
-        # Add upgrade recommendation if update is available
-        if version_info.get("update_available") and version_info.get("upgrade_command"):
-            lines.append(f"   ⬆️ Upgrade: {version_info['upgrade_command']}")
-
-    # Add language info
-    lines.append(f"   🐍 Language: {language}")
-
-    # Add Git info only if available (not degraded)
-    if git_info:
-        lines.append(f"   🌿 Branch: {branch} ({commit})")
-        lines.append(f"   📝 Changes: {changes}")
+    # Warm path: nothing the collectors read has changed since the last
+    # session - reuse their snapshot and only recount changed files, which
+    # unstaged edits can alter without any cheap filesystem trace
+    fingerprint = compute_fingerprint(cwd)
+    snapshot = load_snapshot(fingerprint) if fingerprint else None
+    if snapshot:
+        try:
+            git_info = dict(snapshot["git_info"])
+            if git_info:
+                try:
+                    git_info["changes"] = count_git_changes(cwd)
+                except Exception:
+                    # Graceful degradation - continue without git info
+                    git_info = {}
+            system_message = _build_session_message(
+                critical_rules,
+                snapshot["language"],
+                git_info,
+                snapshot["specs"],
+                snapshot["checkpoints"],
+                snapshot["version_info"],
+            )
+            return HookResult(system_message=system_message)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            # Malformed snapshot - fall through to a full collection
+            pass
 
-        # Add last commit message if available
-        last_commit = git_info.get("last_commit", "")
-        if last_commit:
-            lines.append(f"   🔨 Last: {last_commit}")
+    # OPTIONAL: Git info, SPEC progress, checkpoints and package version are
+    # independent I/O-bound collectors - run them concurrently so the wall time
+    # is bounded by the slowest one instead of the sum of all four
+    git_collector = _Collector(get_git_info, cwd)
+    specs_collector = _Collector(count_specs, cwd)
+    checkpoints_collector = _Collector(list_checkpoints, cwd, max_count=10)
+    version_collector = _Collector(get_package_version_info)
 
-    # Add Checkpoint list (show only the latest 3 items)
-    if checkpoints:
-        lines.append(f"   🗂️  Checkpoints: {len(checkpoints)} available")
-        for cp in reversed(checkpoints[-3:]):  # Latest 3 items
-            branch_short = cp["branch"].replace("before-", "")
-            lines.append(f"      📌 {branch_short}")
-        lines.append("")  # Blank line before restore command
-        lines.append("   ↩️  Restore: /alfred:0-project restore")
+    # One deadline shared by all collectors, so waits don't add up
+    started = time.monotonic()
+    deadline = started + OPTIONAL_RESULT_TIMEOUT
 
-    # Add SPEC progress only if available (not degraded) - at the bottom
-    if specs["total"] > 0:
-        lines.append(f"   📋 SPEC Progress: {spec_progress} ({specs['percentage']}%)")
+    # CRITICAL: Language detection - MUST succeed (no try-except)
+    language = detect_language(cwd)
 
-    system_message = "\n".join(lines)
+    checkpoints = checkpoints_collector.result(
+        min(deadline, started + CHECKPOINT_RESULT_TIMEOUT), []
+    )
+    git_info = git_collector.result(deadline, {})
+    specs = specs_collector.result(deadline, {"completed": 0, "total": 0, "percentage": 0})
+    version_info = version_collector.result(deadline, {})
+
+    system_message = _build_session_message(
+        critical_rules, language, git_info, specs, checkpoints, version_info
+    )
+
+    # Snapshot only complete (non-degraded) results for the next session.
+    # A failed PyPI lookup writes no version cache, so the fingerprint would
+    # not change and the "unknown" latest version would stay pinned.
+    collectors = (git_collector, specs_collector, checkpoints_collector, version_collector)
+    version_degraded = (
+        version_info.get("latest") == "unknown" and version_info.get("current") != "dev"
+    )
+    if fingerprint and git_info and not version_degraded and all(c.delivered for c in collectors):
+        save_snapshot(fingerprint, {
+            "language": language,
+            "git_info": {key: value for key, value in git_info.items() if key != "changes"},
+            "specs": specs,
+            "checkpoints": checkpoints,
+            "version_info": version_info,
+        })
 
     return HookResult(system_message=system_message)
 